@@ -5,9 +5,15 @@
 import abc
 import asyncio
 import logging
+import sys
 from datetime import datetime
-from json import dumps
-from typing import Any, Dict, Optional, Set, cast
+from json import dumps, loads
+from typing import Any, Dict, Optional, Set, Union, cast
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from mirai import exceptions
 from mirai.api_provider import ApiProvider, Method
@@ -22,11 +28,32 @@ def _json_default(obj):  # 支持 datetime
         return int(obj.timestamp())
 
 
+if orjson is not None:
+    # datetime 交给 _json_default 处理，与标准库的行为保持一致。
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
 def json_dumps(obj) -> str:
     """保存为 json。"""
+    if orjson is not None:
+        return json_dumps_bytes(obj).decode('utf-8')
     return dumps(obj, default=_json_default)
 
 
+def json_dumps_bytes(obj) -> bytes:
+    """保存为 UTF-8 编码的 json。安装了 orjson 时，使用 orjson 直接生成。"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS)
+    return dumps(obj, default=_json_default).encode('utf-8')
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """解析 json。安装了 orjson 时，使用 orjson 直接解析原始数据。"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return loads(data)
+
+
 def error_handler_async(errors):
     """错误处理装饰器。"""
     def wrapper(func):
@@ -179,5 +206,7 @@ class Adapter(ApiProvider, AdapterInterface):
             *args: 事件参数。
             **kwargs: 事件参数。
         """
+        # 驻留事件名，使事件总线中按事件名的字典查找可以直接比较指针。
+        event = sys.intern(event)
         coros = [bus.emit(event, *args, **kwargs) for bus in self.buses]
         return sum(await asyncio.gather(*coros), [])
@@ -11,7 +11,8 @@ import httpx
 
 from mirai import exceptions
 from mirai.adapters.base import (
-    Adapter, AdapterInterface, error_handler_async, json_dumps
+    Adapter, AdapterInterface, error_handler_async, json_dumps_bytes,
+    json_loads
 )
 from mirai.api_provider import Method
 from mirai.tasks import Tasks
@@ -22,7 +23,7 @@ logger = logging.getLogger(__name__)
 def _parse_response(response: httpx.Response) -> dict:
     """根据 API 返回结果解析错误信息。"""
     response.raise_for_status()
-    result = response.json()
+    result = json_loads(response.content)
     if result.get('code', 0) != 0:
         raise exceptions.ApiError(result)
     return result
@@ -112,7 +113,7 @@ class HTTPAdapter(Adapter):
                     json: dict) -> Optional[dict]:
         """调用 POST 方法。"""
         # 使用自定义的 json.dumps
-        content = json_dumps(json).encode('utf-8')
+        content = json_dumps_bytes(json)
         try:
             response = await client.post(
                 url,
@@ -9,7 +9,9 @@ from typing import Mapping, Optional, cast
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
-from mirai.adapters.base import Adapter, AdapterInterface, json_dumps
+from mirai.adapters.base import (
+    Adapter, AdapterInterface, json_dumps_bytes, json_loads
+)
 from mirai.api_provider import Method
 from mirai.asgi import ASGI
 
@@ -17,9 +19,9 @@ logger = logging.getLogger(__name__)
 
 
 class YiriMiraiJSONResponse(JSONResponse):
-    """调用自定义的 json_dumps 的 JSONResponse。"""
+    """调用自定义的 json_dumps_bytes 的 JSONResponse。"""
     def render(self, content) -> bytes:
-        return json_dumps(content).encode('utf-8')
+        return json_dumps_bytes(content)
 
 
 class WebHookAdapter(Adapter):
@@ -72,7 +74,7 @@ class WebHookAdapter(Adapter):
                         status_code=401, content={'error': 'Unauthorized'}
                     )
             # 处理事件
-            event = await request.json()
+            event = json_loads(await request.body())
             result = await self.handle_event(event)
             return YiriMiraiJSONResponse(result)
 
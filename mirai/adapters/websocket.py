@@ -4,7 +4,6 @@
 """
 
 import asyncio
-import json
 import logging
 import random
 import time
@@ -19,7 +18,7 @@ from websockets.exceptions import (
 
 from mirai import exceptions
 from mirai.adapters.base import (
-    Adapter, AdapterInterface, error_handler_async, json_dumps
+    Adapter, AdapterInterface, error_handler_async, json_dumps, json_loads
 )
 from mirai.api_provider import Method
 from mirai.tasks import Tasks
@@ -138,7 +137,7 @@ class WebSocketAdapter(Adapter):
                 #       // Event Content
                 #   }
                 # }
-                response = json.loads(await self.connection.recv())
+                response = json_loads(await self.connection.recv())
                 data = response['data']
 
                 logger.debug(
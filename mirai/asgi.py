@@ -3,19 +3,16 @@
 import asyncio
 import functools
 import logging
+import sys
 from inspect import iscoroutinefunction
 from typing import (
-    TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Tuple, Union,
-    cast
+    Awaitable, Callable, Dict, List, Optional, Tuple, Union, cast
 )
 
-if TYPE_CHECKING:
-    from typing_extensions import Literal
+if sys.version_info >= (3, 8):
+    from typing import Literal
 else:
-    try:
-        from typing import Literal
-    except ImportError:
-        from typing_extensions import Literal
+    from typing_extensions import Literal
 
 from starlette.applications import Starlette
 from starlette.requests import Request
@@ -3,29 +3,26 @@
 此模块提供 API 调用与返回数据解析相关。
 """
 import logging
+import sys
 from datetime import datetime
 from enum import Enum, Flag
 from pathlib import Path
 from typing import (
-    TYPE_CHECKING, Any, Generic, Iterable, List, Optional, Type, TypeVar,
-    Union, cast
+    Any, Generic, Iterable, List, Optional, Type, TypeVar, Union, cast
 )
 
 from mirai.exceptions import ApiParametersError
 
-if TYPE_CHECKING:
-    from typing_extensions import Literal
+if sys.version_info >= (3, 8):
+    from typing import Literal
 else:
-    try:
-        from typing import Literal
-    except ImportError:
-        from typing_extensions import Literal
+    from typing_extensions import Literal
 
 from pydantic import ValidationError, validator
 
 from mirai.api_provider import ApiProvider, Method
 from mirai.models.base import (
-    MiraiBaseModel, MiraiIndexedMetaclass, MiraiIndexedModel
+    MiraiBaseModel, MiraiIndexedMetaclass, MiraiIndexedModel, MiraiStrictModel
 )
 from mirai.models.entities import (
     Friend, Group, GroupConfigModel, GroupMember, MemberInfoModel
@@ -135,7 +132,7 @@ class Sex(str, Enum):
         return repr(self.value)
 
 
-class ProfileResponse(MiraiBaseModel):
+class ProfileResponse(MiraiStrictModel):
     """好友资料。"""
     nickname: str
     """昵称。"""
@@ -157,7 +154,7 @@ class MessageResponse(Response):
     """消息的 message_id。"""
 
 
-class DownloadInfo(MiraiBaseModel):
+class DownloadInfo(MiraiStrictModel):
     """文件的下载信息。"""
     sha1: str
     """文件的 SHA1。"""
@@ -175,7 +172,7 @@ class DownloadInfo(MiraiBaseModel):
     """最后修改时间。"""
 
 
-class FileProperties(MiraiBaseModel):
+class FileProperties(MiraiStrictModel):
     """文件对象。"""
     name: str
     """文件名。"""
@@ -2,16 +2,26 @@
 """
 此模块提供 YiriMirai 中使用的 pydantic 模型的基类。
 """
-from typing import Dict, List, Type
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 import pydantic.main as pdm
-from pydantic import BaseModel
+from pydantic import VERSION as PYDANTIC_VERSION
+from pydantic import BaseModel, Extra
+from pydantic.datetime_parse import parse_datetime
+from pydantic.fields import SHAPE_SINGLETON, ModelField
+from pydantic.typing import all_literal_values, is_literal_type
 
 
 class MiraiMetaclass(pdm.ModelMetaclass):
     """此类是 YiriMirai 中使用的 pydantic 模型的元类的基类。"""
 
 
+@lru_cache(maxsize=None)
 def to_camel(name: str) -> str:
     """将下划线命名风格转换为小驼峰命名。"""
     if name[:2] == '__':  # 不处理双下划线开头的特殊命名。
@@ -20,6 +30,207 @@ def to_camel(name: str) -> str:
     return ''.join(name_parts[:1] + [x.title() for x in name_parts[1:]])
 
 
+def _version_tuple(version: str) -> Tuple[int, ...]:
+    """将版本号转换为整数元组，只取前三段。"""
+    return tuple(int(part) for part in re.findall(r'\d+', version)[:3])
+
+
+if _version_tuple(PYDANTIC_VERSION) >= (1, 9, 2):
+    NO_COPY_ON_MODEL_VALIDATION: Any = 'none'
+else:
+    # pydantic 1.8 ~ 1.9.1 中此配置为布尔值，False 表示不复制。
+    NO_COPY_ON_MODEL_VALIDATION = False
+"""`Config.copy_on_model_validation` 中表示“作为字段传入已构造的对象时，直接使用、不复制”的取值。"""
+
+
+_TrustedField = Tuple[str, str, Optional[str],
+                      Optional[Callable[[Any], Any]], ModelField]
+_TrustedPlan = Tuple[Tuple[_TrustedField, ...], bool]
+
+_PLAIN_TYPES = (int, str, bool, float)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MS_WATERSHED = int(2e10)  # 与 pydantic 一致，超过此值的时间戳按毫秒处理。
+
+
+def _trusted_datetime(value: Any) -> datetime:
+    """可信数据中时间字段的转换。
+
+    mirai-api-http 发送秒级时间戳，直接计算对应的时间，结果与 pydantic 的解析一致。
+    """
+    if value.__class__ is int and -_MS_WATERSHED <= value <= _MS_WATERSHED:
+        return _EPOCH + timedelta(seconds=value)
+    return parse_datetime(value)
+
+
+def _trusted_converter(field: ModelField,
+                       intern: bool = False) -> Optional[Callable[[Any], Any]]:
+    """获取可信数据中字段值的转换函数，无需转换时返回 None。
+
+    Args:
+        field: 字段。
+        intern: 是否驻留字符串字段的值。
+
+    Raises:
+        TypeError: 字段无法跳过校验。
+    """
+    type_ = field.type_
+    if field.shape != SHAPE_SINGLETON or field.sub_fields or field.class_validators:
+        raise TypeError(field.name)
+    if type_ is str and intern:
+        # 解析 json 得到的字符串都是新对象，驻留后比较和字典查找可以直接比较指针。
+        return sys.intern
+    if type_ in _PLAIN_TYPES:
+        return None
+    if is_literal_type(type_):
+        # 与 pydantic 相同，映射到 Literal 中的值本身：既检查了取值，相同的值也共享同一对象。
+        return {v: v for v in all_literal_values(type_)}.__getitem__
+    if type_ is datetime:
+        return _trusted_datetime
+    if isinstance(type_, type):
+        if issubclass(type_, Enum):
+            # 直接查值到成员的映射，省去 Enum.__call__ 的开销。未知的值引发 KeyError。
+            return type_._value2member_map_.__getitem__
+        if issubclass(type_, MiraiBaseModel):
+            if type_.get_trusted_plan() is None:
+                return type_.validate
+            return _nested_converter(type_)
+    raise TypeError(field.name)
+
+
+def _nested_converter(type_: Type['MiraiBaseModel']) -> Callable[[Any], Any]:
+    """嵌套模型字段的转换函数。
+
+    dict 使用嵌套模型的 `parse_trusted` 构造，已是该模型的对象直接使用，其余取值交由 pydantic 校验。
+    """
+    parser = type_.get_trusted_parser()
+    validate = type_.validate
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, dict):
+            return parser(value)
+        if isinstance(value, type_):
+            return value
+        return validate(value)
+
+    return convert
+
+
+def trusted_init(init: Callable) -> Callable:
+    """标记模型的 `__init__` 只整理参数，再交由 pydantic 构造。
+
+    `parse_trusted` 不调用 `__init__`，因此默认不用于自定义了 `__init__` 的模型。
+    被标记的 `__init__` 不影响构造结果，`parse_trusted` 可以跳过它。子类重写的 `__init__` 需另行标记。
+    """
+    init.__trusted_init__ = True  # type: ignore
+    return init
+
+
+def _is_constant(value: Any) -> bool:
+    """判断默认值是否不可变，可以在多个对象间共享，无需 pydantic 复制。"""
+    return value is None or value.__class__ in _PLAIN_TYPES
+
+
+def _used_keys(obj: dict, keys: Tuple[Tuple[str, Optional[str]], ...]) -> set:
+    """计算解析时用到的键，其余的键为额外值。"""
+    used = set()
+    for alias, alt in keys:
+        if alias in obj:
+            used.add(alias)
+        elif alt is not None and alt in obj:
+            used.add(alt)
+    return used
+
+
+def _compile_trusted_parser(cls: Type['MiraiBaseModel'],
+                            plan: _TrustedPlan) -> Callable[[dict], Any]:
+    """根据构造方案，生成模型专用的构造函数。
+
+    生成的函数逐字段展开，字段名和别名直接写入代码中，默认值和转换函数按名称绑定到函数的全局变量，
+    省去了通用构造过程中对构造方案的遍历和分支判断。
+    """
+    fields, allow_extra = plan
+    namespace: Dict[str, Any] = {
+        'cls': cls,
+        'parse_obj': cls.parse_obj,
+        'object_setattr': object.__setattr__,
+        'missing': object(),
+        'used_keys': _used_keys,
+        'keys': tuple((alias, alt) for _, alias, alt, _, _ in fields),
+    }
+    lines = [
+        'def parse_trusted(obj):',
+        '    values = {}',
+        '    fields_set = set()',
+        '    try:',
+    ]
+    for i, (name, alias, alt, convert, field) in enumerate(fields):
+        lines.append(f'        value = obj.get({alias!r}, missing)')
+        if alt is not None:
+            lines.append('        if value is missing:')
+            lines.append(f'            value = obj.get({alt!r}, missing)')
+        lines.append('        if value is not missing:')
+        if convert is not None:
+            namespace[f'convert_{i}'] = convert
+            if field.allow_none:
+                lines.append('            if value is not None:')
+                lines.append(f'                value = convert_{i}(value)')
+            else:
+                # 字段不允许为 None 时由 pydantic 报错，转换函数可能会接受 None，需在此交由 parse_obj 处理。
+                lines.append('            if value is None:')
+                lines.append('                return parse_obj(obj)')
+                lines.append(f'            value = convert_{i}(value)')
+        elif field.type_ in _PLAIN_TYPES:
+            # 类型不符时 pydantic 会转换取值，交由 parse_obj 处理。
+            namespace[f'type_{i}'] = field.type_
+            if field.allow_none:
+                lines.append(
+                    f'            if value is not None and value.__class__ is not type_{i}:'
+                )
+            else:
+                lines.append(f'            if value.__class__ is not type_{i}:')
+            lines.append('                return parse_obj(obj)')
+        lines.append(f'            values[{name!r}] = value')
+        lines.append(f'            fields_set.add({name!r})')
+        if field.required:
+            lines.append('        else:')
+            lines.append('            return parse_obj(obj)')
+        elif field.default_factory is None and _is_constant(field.default):
+            namespace[f'default_{i}'] = field.default
+            lines.append('        else:')
+            lines.append(f'            values[{name!r}] = default_{i}')
+        else:
+            namespace[f'field_{i}'] = field
+            lines.append('        else:')
+            lines.append(f'            values[{name!r}] = field_{i}.get_default()')
+    lines.append('    except (AttributeError, KeyError, TypeError, ValueError):')
+    lines.append('        return parse_obj(obj)')
+    if allow_extra:
+        lines.append('    if len(obj) > len(fields_set):')
+        lines.append('        used = used_keys(obj, keys)')
+        lines.append('        for key, value in obj.items():')
+        lines.append('            if key not in used:')
+        lines.append('                values[key] = value')
+        lines.append('                fields_set.add(key)')
+    lines.append('    model = cls.__new__(cls)')
+    lines.append("    object_setattr(model, '__dict__', values)")
+    lines.append("    object_setattr(model, '__fields_set__', fields_set)")
+    for i, (name, attr) in enumerate(cls.__private_attributes__.items()):
+        if attr.default_factory is None and _is_constant(attr.default):
+            namespace[f'private_default_{i}'] = attr.default
+            lines.append(
+                f'    object_setattr(model, {name!r}, private_default_{i})'
+            )
+        else:
+            namespace[f'private_{i}'] = attr
+            lines.append(
+                f'    object_setattr(model, {name!r}, private_{i}.get_default())'
+            )
+    lines.append('    return model')
+    exec('\n'.join(lines), namespace)
+    return namespace['parse_trusted']
+
+
 class MiraiBaseModel(BaseModel, metaclass=MiraiMetaclass):
     """模型基类。
 
@@ -28,21 +239,102 @@ class MiraiBaseModel(BaseModel, metaclass=MiraiMetaclass):
     2. 允许通过别名访问字段。
     3. 自动生成小驼峰风格的别名，以符合 mirai-api-http 的命名。
     """
-    def __init__(self, *args, **kwargs):
-        """"""
-        super().__init__(*args, **kwargs)
-
+    __trusted__ = False
+    """`parse_subtype` 是否信任传入的数据，使用 `parse_trusted` 跳过逐字段校验。"""
+    __interned__: Tuple[str, ...] = ()
+    """`parse_trusted` 中需要驻留字符串值的字段名。"""
     def __repr__(self) -> str:
         return self.__class__.__name__ + '(' + ', '.join(
-            (f'{k}={repr(v)}' for k, v in self.__dict__.items() if v)
+            [f'{k}={v!r}' for k, v in self.__dict__.items() if v]
         ) + ')'
 
+    @classmethod
+    def get_trusted_plan(cls) -> Optional[_TrustedPlan]:
+        """获取 `parse_trusted` 使用的构造方案，模型无法跳过校验时返回 None。
+
+        构造方案在首次使用时生成，此后缓存在类中。
+        """
+        try:
+            return cls.__dict__['__trusted_plan__']
+        except KeyError:
+            pass
+        cls.__trusted_plan__ = None  # 防止嵌套模型循环引用。
+        plan = None
+        if not (
+            cls.__custom_root_type__ or cls.__pre_root_validators__
+            or cls.__post_root_validators__ or cls.__config__.validate_all
+            or cls.__config__.extra is Extra.forbid
+            or not (
+                cls.__init__ is BaseModel.__init__
+                or getattr(cls.__init__, '__trusted_init__', False)
+            )
+        ):
+            try:
+                alt = cls.__config__.allow_population_by_field_name
+                fields = tuple(
+                    (
+                        name, field.alias,
+                        name if alt and field.alt_alias else None,
+                        _trusted_converter(field, name in cls.__interned__),
+                        field
+                    ) for name, field in cls.__fields__.items()
+                )
+                plan = (fields, cls.__config__.extra is Extra.allow)
+            except TypeError:
+                pass
+        cls.__trusted_plan__ = plan
+        return plan
+
+    @classmethod
+    def get_trusted_parser(cls) -> Callable[[dict], Any]:
+        """获取 `parse_trusted` 使用的构造函数。
+
+        构造函数根据构造方案生成，此后缓存在类中。模型无法跳过校验时，返回 `parse_obj`。
+        """
+        try:
+            return cls.__dict__['__trusted_parser__']
+        except KeyError:
+            pass
+        plan = cls.get_trusted_plan()
+        if plan is None:
+            parser = cls.parse_obj
+        else:
+            parser = _compile_trusted_parser(cls, plan)
+        cls.__trusted_parser__ = parser
+        return parser
+
+    @classmethod
+    def parse_trusted(cls, obj: dict):
+        """从可信的数据构造模型。
+
+        适用于 mirai-api-http 发送的、结构确定的数据。跳过 pydantic 的逐字段校验，
+        只进行必要的类型转换（时间、枚举、嵌套模型等）。
+        对于无法跳过校验的模型，以及缺少字段或转换失败的数据，交由 `parse_obj` 处理。
+
+        Args:
+            obj: 一个字典，包含了模型对象的属性。
+
+        Returns:
+            构造的对象。
+        """
+        return cls.get_trusted_parser()(obj)
+
     class Config:
         extra = 'allow'
         allow_population_by_field_name = True
         alias_generator = to_camel
 
 
+class MiraiStrictModel(MiraiBaseModel):
+    """字段固定的模型基类。
+
+    与 `MiraiBaseModel` 不同，解析时忽略额外的值，不保存在模型中。
+    适用于实体、配置项等字段稳定的模型，省去了收集额外值的开销。
+    """
+    class Config:
+        extra = 'ignore'
+
+
 class MiraiIndexedMetaclass(MiraiMetaclass):
     """可以通过子类名获取子类的类的元类。"""
     __indexedbases__: List[Type['MiraiIndexedModel']] = []
@@ -54,13 +346,16 @@ class MiraiIndexedMetaclass(MiraiMetaclass):
         if name == 'MiraiIndexedModel':
             cls.__indexedmodel__ = new_cls
             new_cls.__indexes__ = {}
+            new_cls.__indexedroot__ = False
             return new_cls
         # 第二类：MiraiIndexedModel 的直接子类，这些是可以通过子类名获取子类的类。
         if cls.__indexedmodel__ in bases:
             cls.__indexedbases__.append(new_cls)
             new_cls.__indexes__ = {}
+            new_cls.__indexedroot__ = True
             return new_cls
         # 第三类：MiraiIndexedModel 的直接子类的子类，这些添加到直接子类的索引中。
+        new_cls.__indexedroot__ = False
         for base in cls.__indexedbases__:
             if issubclass(new_cls, base):
                 base.__indexes__[name] = new_cls
@@ -71,8 +366,14 @@ class MiraiIndexedMetaclass(MiraiMetaclass):
 
 
 class MiraiIndexedModel(MiraiBaseModel, metaclass=MiraiIndexedMetaclass):
-    """可以通过子类名获取子类的类。"""
+    """可以通过子类名获取子类的类。
+
+    Attributes:
+        __indexes__: 子类名到子类类型的索引。
+        __indexedroot__: 是否为 `MiraiIndexedModel` 的直接子类。
+    """
     __indexes__: Dict[str, Type['MiraiIndexedModel']]
+    __indexedroot__: bool
 
     @classmethod
     def get_subtype(cls, name: str) -> Type['MiraiIndexedModel']:
@@ -102,7 +403,7 @@ class MiraiIndexedModel(MiraiBaseModel, metaclass=MiraiIndexedMetaclass):
         Returns:
             MiraiIndexedModel: 构造的对象。
         """
-        if cls in MiraiIndexedModel.__subclasses__():
-            ModelType = cls.get_subtype(obj['type'])
-            return ModelType.parse_obj(obj)
-        return super().parse_obj(obj)
+        ModelType = cls.get_subtype(obj['type']) if cls.__indexedroot__ else cls
+        if ModelType.__trusted__:
+            return ModelType.get_trusted_parser()(obj)
+        return ModelType.parse_obj(obj)
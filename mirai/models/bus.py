@@ -4,9 +4,9 @@
 
 关于一般的事件总线，参看模块 `mirai.bus`。
 """
+import functools
 import logging
-from collections import defaultdict
-from typing import Any, Awaitable, Callable, List, Type, Union, cast
+from typing import Any, Awaitable, Callable, Dict, List, Type, Union, cast
 
 from mirai.bus import EventBus
 from mirai.models.events import Event
@@ -18,12 +18,16 @@ logger = logging.getLogger(__name__)
 def event_chain_parents(event: str):
     """包含事件及所有父事件的事件链。
 
-    例如：`FriendMessage` 的事件链为 `['FriendMessage', 'MessageEvent', 'Event']`。
+    例如：`FriendMessage` 的事件链为 `('FriendMessage', 'MessageEvent', 'Event')`。
     """
-    event_type = Event.get_subtype(event)
-    while issubclass(event_type, Event):
-        yield event_type.__name__
-        event_type = event_type.__base__
+    return Event.get_subtype(event).__event_chain__
+
+
+async def _dispatch(func: Callable, event: dict):
+    """中间件。负责与底层 bus 沟通，将 event dict 解析为 Event 对象。"""
+    event_model = cast(Event, Event.parse_subtype(event))
+    logger.debug(f'收到事件 {event_model.type}。')
+    return await async_with_exception(func(event_model))
 
 
 class ModelEventBus(EventBus):
@@ -38,7 +42,7 @@ class ModelEventBus(EventBus):
     """
     def __init__(self):
         self.base_bus = EventBus(event_chain_generator=event_chain_parents)
-        self._middlewares = defaultdict(type(None))
+        self._middlewares: Dict[Callable, Callable] = {}
 
     def subscribe(
         self,
@@ -54,14 +58,11 @@ class ModelEventBus(EventBus):
             priority: 优先级，小者优先。
         """
         if isinstance(event_type, str):
+            if not Event.known_tag(event_type):
+                logger.warning(f'未知的事件名 `{event_type}`，事件处理器将响应所有事件。')
             event_type = cast(Type[Event], Event.get_subtype(event_type))
 
-        async def middleware(event: dict):
-            """中间件。负责与底层 bus 沟通，将 event dict 解析为 Event 对象。"""
-            event_model = cast(Event, Event.parse_subtype(event))
-            logger.debug(f'收到事件 {event_model.type}。')
-            return await async_with_exception(func(event_model))
-
+        middleware = functools.partial(_dispatch, func)
         self._middlewares[func] = middleware
         self.base_bus.subscribe(event_type.__name__, middleware, priority)
         logger.debug(f'注册事件 {event_type.__name__} at {func}。')
@@ -78,8 +79,9 @@ class ModelEventBus(EventBus):
         if isinstance(event_type, str):
             event_type = cast(Type[Event], Event.get_subtype(event_type))
 
-        self.base_bus.unsubscribe(event_type.__name__, self._middlewares[func])
-        del self._middlewares[func]
+        self.base_bus.unsubscribe(
+            event_type.__name__, self._middlewares.pop(func, None)
+        )
         logger.debug(f'解除事件注册 {event_type.__name__} at {func}。')
 
     def on(
@@ -3,22 +3,25 @@
 此模块提供实体和配置项模型。
 """
 import abc
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Optional
+from typing import FrozenSet, Optional
 
-if TYPE_CHECKING:
-    from typing_extensions import Literal
+if sys.version_info >= (3, 8):
+    from typing import Literal
 else:
-    try:
-        from typing import Literal
-    except ImportError:
-        from typing_extensions import Literal
+    from typing_extensions import Literal
+
+from pydantic import Field
 
-from mirai.models.base import MiraiBaseModel
+from mirai.models.base import MiraiStrictModel
 
+_EPOCH = datetime.utcfromtimestamp(0)
+"""时间戳 0 对应的时间，作为未知时间字段的默认值。"""
 
-class Entity(MiraiBaseModel):
+
+class Entity(MiraiStrictModel):
     """实体，表示一个用户或群。"""
     id: int
     """QQ 号或群号。"""
@@ -85,9 +88,10 @@ class GroupMember(Entity):
     """群。"""
     special_title: str = ''
     """群头衔。"""
-    join_timestamp: datetime = datetime.utcfromtimestamp(0)
+    # datetime 默认值会在每次实例化时被 pydantic 深拷贝，用 default_factory 共享同一对象。
+    join_timestamp: datetime = Field(default_factory=lambda: _EPOCH)
     """加入群的时间。"""
-    last_speak_timestamp: datetime = datetime.utcfromtimestamp(0)
+    last_speak_timestamp: datetime = Field(default_factory=lambda: _EPOCH)
     """最后一次发言的时间。"""
     mute_time_remaining: int = 0
     """禁言剩余时间。"""
@@ -111,7 +115,7 @@ class Client(Entity):
         return self.platform
 
 
-class Subject(MiraiBaseModel):
+class Subject(MiraiStrictModel):
     """另一种实体类型表示。"""
     id: int
     """QQ 号或群号。"""
@@ -119,15 +123,22 @@ class Subject(MiraiBaseModel):
     """类型。"""
 
 
-class Config(MiraiBaseModel):
+class Config(MiraiStrictModel):
     """配置项类型。"""
+    __config_keys__: FrozenSet[str] = frozenset()
+    """全部配置项名称。"""
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__config_keys__ = frozenset(cls.__fields__)
+
     def modify(self, **kwargs) -> 'Config':
         """修改部分设置。"""
         for k, v in kwargs.items():
-            if k in self.__fields__:
-                setattr(self, k, v)
-            else:
+            if k not in self.__config_keys__:
                 raise ValueError(f'未知配置项: {k}')
+            # 配置项不做校验，直接写入，跳过 pydantic 的 __setattr__。
+            self.__dict__[k] = v
+            self.__fields_set__.add(k)
         return self
 
 
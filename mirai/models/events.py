@@ -2,54 +2,84 @@
 """
 此模块提供事件模型。
 """
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional, Type, Union, cast
+from typing import Optional, Tuple, Type, cast
 
-if TYPE_CHECKING:
-    from typing_extensions import Literal
+if sys.version_info >= (3, 8):
+    from typing import Literal
 else:
-    try:
-        from typing import Literal
-    except ImportError:
-        from typing_extensions import Literal
+    from typing_extensions import Literal
 
-from mirai.models.base import MiraiIndexedModel
+from mirai.models.base import MiraiIndexedMetaclass, MiraiIndexedModel
 from mirai.models.entities import (
     Client, Friend, Group, GroupMember, Permission, Subject
 )
 from mirai.models.message import MessageChain
 
 
-class Event(MiraiIndexedModel):
+class EventMetaclass(MiraiIndexedMetaclass):
+    """事件元类。"""
+    def __new__(cls, name, bases, attrs, **kwargs):
+        new_cls = super().__new__(cls, name, bases, attrs, **kwargs)
+        # 预先计算事件链，触发事件时无需再沿继承关系向上查找。
+        new_cls.__event_chain__ = (name, ) + getattr(
+            new_cls.__base__, '__event_chain__', ()
+        )
+        return new_cls
+
+
+class Event(MiraiIndexedModel, metaclass=EventMetaclass):
     """事件基类。
 
     Args:
         type: 事件名。
     """
+    __event_chain__: Tuple[str, ...]
+    __trusted__ = True
+    """解析事件时信任 mirai-api-http 发送的数据，跳过逐字段校验。设为 False 以启用完整校验。"""
+    __interned__ = ('type',)
     type: str
     """事件名。"""
     def __repr__(self):
         return self.__class__.__name__ + '(' + ', '.join(
-            (
-                f'{k}={repr(v)}'
-                for k, v in self.__dict__.items() if k != 'type' and v
-            )
+            [
+                f'{k}={v!r}'
+                for k, v in self.__dict__.items() if v and k != 'type'
+            ]
         ) + ')'
 
     @classmethod
     def parse_subtype(cls, obj: dict) -> 'Event':
+        # 未知事件由 get_subtype 回退到 Event，只有数据不合法时才会引发异常。
+        ModelType = cls.get_subtype(obj['type']) if cls.__indexedroot__ else cls
         try:
-            return cast(Event, super().parse_subtype(obj))
+            if ModelType.__trusted__:
+                return cast(Event, ModelType.get_trusted_parser()(obj))
+            return cast(Event, ModelType.parse_obj(obj))
         except ValueError:
             return Event(type=obj['type'])
 
+    @classmethod
+    def known_tag(cls, name: str) -> bool:
+        """判断事件名是否对应已定义的事件类型。
+
+        Args:
+            name: 事件名。
+
+        Returns:
+            bool: 是否为已知的事件名。
+        """
+        return name in Event.__indexes__ or name == 'Event'
+
     @classmethod
     def get_subtype(cls, name: str) -> Type['Event']:
-        try:
-            return cast(Type[Event], super().get_subtype(name))
-        except ValueError:
-            return Event
+        # 未知事件回退到 Event，直接查字典，不经过异常。
+        type_ = cls.__indexes__.get(name, Event)
+        if cls is Event or issubclass(type_, cls):
+            return type_
+        return Event
 
 
 ###############################
@@ -61,8 +91,6 @@ class BotEvent(Event):
         type: 事件名。
         qq: Bot 的 QQ 号。
     """
-    type: str
-    """事件名。"""
     qq: int
     """Bot 的 QQ 号。"""
 
@@ -143,8 +171,6 @@ class FriendEvent(Event):
         type: 事件名。
         friend: 事件对应的好友。
     """
-    type: str
-    """事件名。"""
     friend: Friend
     """事件对应的好友。"""
 
@@ -159,8 +185,6 @@ class FriendInputStatusChangedEvent(FriendEvent):
     """
     type: str = 'FriendInputStatusChangedEvent'
     """事件名。"""
-    friend: Friend
-    """事件对应的好友。"""
     inputting: bool
     """是否正在输入。"""
 
@@ -176,8 +200,6 @@ class FriendNickChangedEvent(FriendEvent):
     """
     type: str = 'FriendNickChangedEvent'
     """事件名。"""
-    friend: Friend
-    """事件对应的好友。"""
     from_: str
     """原昵称。"""
     to: str
@@ -198,15 +220,24 @@ class GroupEvent(Event):
     # group: Group
     # 一个奇怪的现象：群事件不一定有 group，它可能藏在 opeartor.group 里
 
-    type: str
-    """事件名。"""
-    def __getattr__(self, name) -> Union[Group, Any]:
-        if name == 'group':
-            member = getattr(self, 'operator',
-                             None) or getattr(self, 'member', None)
-            if member:
-                return member.group
-        return getattr(super(), name)
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # 没有 group 字段的群事件，添加从 operator 或 member 获取群的 group 属性。
+        fields = cls.__fields__
+        if 'group' not in fields and 'group' not in cls.__dict__ and (
+            'operator' in fields or 'member' in fields
+        ):
+            cls.group = property(_get_member_group)
+
+
+def _get_member_group(event: GroupEvent) -> Optional[Group]:
+    """获取群事件的操作者或群成员所在的群。"""
+    values = event.__dict__
+    operator = values.get('operator')
+    if operator is not None:
+        return operator.group
+    member = values.get('member')
+    return member.group if member is not None else None
 
 
 class BotGroupPermissionChangeEvent(GroupEvent):
@@ -240,7 +271,7 @@ class BotMuteEvent(GroupEvent):
     """事件名。"""
     duration_seconds: int
     """禁言时间，单位秒。"""
-    operator: Optional[GroupMember]
+    operator: Optional[GroupMember] = None
     """禁言的操作者。"""
 
 
@@ -253,7 +284,7 @@ class BotUnmuteEvent(GroupEvent):
     """
     type: str = 'BotUnmuteEvent'
     """事件名。"""
-    operator: Optional[GroupMember]
+    operator: Optional[GroupMember] = None
     """取消禁言的操作者。"""
 
 
@@ -296,7 +327,7 @@ class BotLeaveEventKick(GroupEvent):
     """事件名。"""
     group: Group
     """Bot 被踢出的群。"""
-    operator: Optional[GroupMember]
+    operator: Optional[GroupMember] = None
     """踢出 Bot 的管理员。"""
 
 
@@ -321,7 +352,7 @@ class GroupRecallEvent(GroupEvent):
     """原消息发送时间。"""
     group: Group
     """消息撤回所在的群。"""
-    operator: Optional[GroupMember]
+    operator: Optional[GroupMember] = None
     """消息撤回的操作者，为 None 表示 Bot 操作。"""
 
 
@@ -367,7 +398,7 @@ class GroupNameChangeEvent(GroupEvent):
     """新群名。"""
     group: Group
     """群名改名的群。"""
-    operator: Optional[GroupMember]
+    operator: Optional[GroupMember] = None
     """操作者，为 None 表示 Bot 操作。"""
 
 
@@ -389,7 +420,7 @@ class GroupEntranceAnnouncementChangeEvent(GroupEvent):
     """新公告。"""
     group: Group
     """群公告改变的群。"""
-    operator: Optional[GroupMember]
+    operator: Optional[GroupMember] = None
     """操作者，为 None 表示 Bot 操作。"""
 
 
@@ -411,7 +442,7 @@ class GroupMuteAllEvent(GroupEvent):
     """现在是否处于全员禁言。"""
     group: Group
     """全员禁言的群。"""
-    operator: Optional[GroupMember]
+    operator: Optional[GroupMember] = None
     """操作者，为 None 表示 Bot 操作。"""
 
 
@@ -433,7 +464,7 @@ class GroupAllowAnonymousChatEvent(GroupEvent):
     """现在是否允许匿名聊天。"""
     group: Group
     """匿名聊天状态改变的群。"""
-    operator: Optional[GroupMember]
+    operator: Optional[GroupMember] = None
     """操作者，为 None 表示 Bot 操作。"""
 
 
@@ -477,7 +508,7 @@ class GroupAllowMemberInviteEvent(GroupEvent):
     """现在是否允许群员邀请好友加群。"""
     group: Group
     """允许群员邀请好友加群状态改变的群。"""
-    operator: Optional[GroupMember]
+    operator: Optional[GroupMember] = None
     """操作者，为 None 表示 Bot 操作。"""
 
 
@@ -493,7 +524,7 @@ class MemberJoinEvent(GroupEvent):
     """事件名。"""
     member: GroupMember
     """加入的群成员。"""
-    invitor: Optional[GroupMember]
+    invitor: Optional[GroupMember] = None
     """邀请者。"""
 
 
@@ -510,7 +541,7 @@ class MemberLeaveEventKick(GroupEvent):
     """事件名。"""
     member: GroupMember
     """被踢出的群成员。"""
-    operator: Optional[GroupMember]
+    operator: Optional[GroupMember] = None
     """被踢出的群的管理员。"""
 
 
@@ -613,7 +644,7 @@ class MemberUnmuteEvent(GroupEvent):
     """事件名。"""
     member: GroupMember
     """被取消禁言的群成员。"""
-    operator: Optional[GroupMember]
+    operator: Optional[GroupMember] = None
     """被取消禁言的群管理员。"""
 
 
@@ -648,8 +679,6 @@ class RequestEvent(Event):
         type: 事件名。
         event_id: 事件标识，响应该事件时的标识。
     """
-    type: str
-    """事件名。"""
     event_id: int
     """事件标识，响应该事件时的标识。"""
     from_id: int
@@ -671,10 +700,6 @@ class NewFriendRequestEvent(RequestEvent):
     """
     type: str = 'NewFriendRequestEvent'
     """事件名。"""
-    event_id: int
-    """事件标识，响应该事件时的标识。"""
-    from_id: int
-    """申请人 QQ 号。"""
     group_id: int
     """申请人如果通过某个群添加好友，该项为该群群号；否则为0。"""
     nick: str
@@ -697,10 +722,6 @@ class MemberJoinRequestEvent(RequestEvent):
     """
     type: str = 'MemberJoinRequestEvent'
     """事件名。"""
-    event_id: int
-    """事件标识，响应该事件时的标识。"""
-    from_id: int
-    """申请人 QQ 号。"""
     group_id: int
     """申请人申请入群的群号。"""
     group_name: str
@@ -725,8 +746,6 @@ class BotInvitedJoinGroupRequestEvent(RequestEvent):
     """
     type: str = 'BotInvitedJoinGroupRequestEvent'
     """事件名。"""
-    event_id: int
-    """事件标识，响应该事件时的标识。"""
     from_id: int
     """邀请人 QQ 号。"""
     group_id: int
@@ -775,8 +794,6 @@ class OtherClientEvent(Event):
         type: 事件名。
         client: 其他设备。
     """
-    type: str
-    """事件名。"""
     client: Client
     """其他设备。"""
 
@@ -809,6 +826,11 @@ class ClientKind(int, Enum):
     WIN8 = 69899
     WINPHONE = 65804
 
+    @classmethod
+    def from_int(cls, value: int) -> Optional['ClientKind']:
+        """根据设备类型代码获取设备类型，未知的代码返回 None。"""
+        return cast(Optional[ClientKind], cls._value2member_map_.get(value))
+
 
 class OtherClientOnlineEvent(OtherClientEvent):
     """其它客户端上线事件。
@@ -820,8 +842,6 @@ class OtherClientOnlineEvent(OtherClientEvent):
     """
     type: str = 'OtherClientOnlineEvent'
     """事件名。"""
-    client: Client
-    """其他设备。"""
     kind: Optional[ClientKind] = None
     """详细设备类型。"""
 
@@ -835,8 +855,6 @@ class OtherClientOfflineEvent(OtherClientEvent):
     """
     type: str = 'OtherClientOfflineEvent'
     """事件名。"""
-    client: Client
-    """其他设备。"""
 
 
 ###############################
@@ -849,8 +867,6 @@ class CommandEvent(Event):
     Args:
         type: 事件名。
     """
-    type: str
-    """事件名。"""
 
 
 class CommandExecutedEvent(CommandEvent):
@@ -867,9 +883,9 @@ class CommandExecutedEvent(CommandEvent):
     """事件名。"""
     name: str
     """命令名称。"""
-    friend: Optional[Friend]
+    friend: Optional[Friend] = None
     """发送命令的好友, 从控制台发送为 None。"""
-    member: Optional[GroupMember]
+    member: Optional[GroupMember] = None
     """发送命令的群成员, 从控制台发送为 None。"""
     args: MessageChain
     """命令执行时的参数。"""
@@ -884,8 +900,6 @@ class MessageEvent(Event):
         type: 事件名。
         message_chain: 消息内容。
     """
-    type: str
-    """事件名。"""
     message_chain: MessageChain
     """消息内容。"""
 
@@ -902,8 +916,6 @@ class FriendMessage(MessageEvent):
     """事件名。"""
     sender: Friend
     """发送消息的好友。"""
-    message_chain: MessageChain
-    """消息内容。"""
 
 
 class GroupMessage(MessageEvent):
@@ -918,8 +930,6 @@ class GroupMessage(MessageEvent):
     """事件名。"""
     sender: GroupMember
     """发送消息的群成员。"""
-    message_chain: MessageChain
-    """消息内容。"""
     @property
     def group(self) -> Group:
         return self.sender.group
@@ -937,8 +947,6 @@ class TempMessage(MessageEvent):
     """事件名。"""
     sender: GroupMember
     """发送消息的群成员。"""
-    message_chain: MessageChain
-    """消息内容。"""
     @property
     def group(self) -> Group:
         return self.sender.group
@@ -956,8 +964,6 @@ class StrangerMessage(MessageEvent):
     """事件名。"""
     sender: Friend
     """发送消息的人。"""
-    message_chain: MessageChain
-    """消息内容。"""
 
 
 class FriendSyncMessage(MessageEvent):
@@ -972,8 +978,6 @@ class FriendSyncMessage(MessageEvent):
     """事件名。"""
     subject: Friend
     """发送消息的目标好友。"""
-    message_chain: MessageChain
-    """消息内容。"""
 
 
 class GroupSyncMessage(MessageEvent):
@@ -988,8 +992,6 @@ class GroupSyncMessage(MessageEvent):
     """事件名。"""
     subject: Group
     """发送消息的目标群组。"""
-    message_chain: MessageChain
-    """消息内容。"""
     @property
     def group(self) -> Group:
         return self.subject
@@ -1007,8 +1009,6 @@ class TempSyncMessage(MessageEvent):
     """事件名。"""
     subject: GroupMember
     """发送消息的目标群成员。"""
-    message_chain: MessageChain
-    """消息内容。"""
     @property
     def group(self) -> Group:
         return self.subject.group
@@ -1026,8 +1026,6 @@ class StrangerSyncMessage(MessageEvent):
     """事件名。"""
     subject: Friend
     """发送消息的目标。"""
-    message_chain: MessageChain
-    """消息内容。"""
 
 
 class OtherClientMessage(MessageEvent):
@@ -1042,8 +1040,6 @@ class OtherClientMessage(MessageEvent):
     """事件名。"""
     sender: Client
     """发送消息的人。"""
-    message_chain: MessageChain
-    """消息内容。"""
 
 
 class BotLeaveEventDisband(GroupEvent):
@@ -1057,7 +1053,7 @@ class BotLeaveEventDisband(GroupEvent):
     """事件名。"""
     group: Group
     """被解散的群聊"""
-    operator: Optional[GroupMember]
+    operator: Optional[GroupMember] = None
     """操作者"""
 
 
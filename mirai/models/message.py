@@ -4,24 +4,39 @@
 """
 import itertools
 import logging
+import operator
+import os
 import re
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import (
-    Iterable, List, Optional, Tuple, Type, TypeVar, Union, cast, overload
+    Dict, Iterable, List, Optional, Set, Tuple, Type, TypeVar, Union, cast,
+    overload
 )
 
-from pydantic import HttpUrl, validator
+from pydantic import HttpUrl, ValidationError, validator
+from pydantic.error_wrappers import ErrorWrapper
+
+try:
+    from pybase64 import b64encode  # type: ignore
+except ImportError:
+    from base64 import b64encode
 
 from mirai.models.base import (
-    MiraiBaseModel, MiraiIndexedMetaclass, MiraiIndexedModel
+    NO_COPY_ON_MODEL_VALIDATION, MiraiBaseModel, MiraiIndexedMetaclass,
+    MiraiIndexedModel, trusted_init
 )
 from mirai.models.entities import Friend, GroupMember
-from mirai.utils import kmp
 
 logger = logging.getLogger(__name__)
 
+_DESERIALIZE_PATTERN = re.compile(r'\\([\[\]:,\\])')
+_DESERIALIZE_REPL = operator.itemgetter(1)  # 取出被转义的字符，在 C 中完成，无需 lambda。
+
+_SMALL_FILE_SIZE = 1 << 20
+"""小于此大小的本地文件直接同步读取。"""
+
 
 def serialize(s: str) -> str:
     """mirai 码转义。
@@ -32,8 +47,12 @@ def serialize(s: str) -> str:
     Returns:
         str: 去转义后的字符串。
     """
-    return re.sub(r'[\[\]:,\\]', lambda match: '\\' + match.group(0),
-                  s).replace('\n', '\\n').replace('\r', '\\r')
+    # 逐个字符替换，每次都在 C 中完成。反斜杠需最先转义，以免重复转义。
+    return (
+        s.replace('\\', '\\\\').replace('[', '\\[').replace(']', '\\]')
+        .replace(':', '\\:').replace(',', '\\,')
+        .replace('\n', '\\n').replace('\r', '\\r')
+    )
 
 
 def deserialize(s: str) -> str:
@@ -45,8 +64,8 @@ def deserialize(s: str) -> str:
     Returns:
         str: 去转义后的字符串。
     """
-    return re.sub(
-        r'\\([\[\]:,\\])', lambda match: match.group(1),
+    return _DESERIALIZE_PATTERN.sub(
+        _DESERIALIZE_REPL,
         s.replace('\\n', '\n').replace('\\r', '\r')
     )
 
@@ -54,7 +73,8 @@ def deserialize(s: str) -> str:
 class MessageComponentMetaclass(MiraiIndexedMetaclass):
     """消息组件元类。"""
     __message_component__ = None
-
+    __component_types__: Set[type] = set()
+    """全部消息组件类型，用于快速判断对象是否为消息组件。"""
     def __new__(cls, name, bases, attrs, **kwargs):
         new_cls = super().__new__(cls, name, bases, attrs, **kwargs)
         if name == 'MessageComponent':
@@ -63,14 +83,17 @@ class MessageComponentMetaclass(MiraiIndexedMetaclass):
         if not cls.__message_component__:
             return new_cls
 
+        cls.__component_types__.add(new_cls)
+
         for base in bases:
             if issubclass(base, cls.__message_component__):
                 # 获取字段名
                 if hasattr(new_cls, '__fields__'):
                     # 忽略 type 字段
-                    new_cls.__parameter_names__ = list(new_cls.__fields__)[1:]
+                    new_cls.__parameter_names__ = tuple(new_cls.__fields__)[1:]
                 else:
-                    new_cls.__parameter_names__ = []
+                    new_cls.__parameter_names__ = ()
+                new_cls.__parameter_count__ = len(new_cls.__parameter_names__)
                 break
 
         return new_cls
@@ -78,6 +101,9 @@ class MessageComponentMetaclass(MiraiIndexedMetaclass):
 
 class MessageComponent(MiraiIndexedModel, metaclass=MessageComponentMetaclass):
     """消息组件。"""
+    __trusted__ = True
+    """解析消息链时信任传入的数据，跳过逐字段校验。取值类型不符时，仍会交由 pydantic 校验。"""
+    __interned__ = ('type',)
     type: str
     """消息组件类型。"""
     def __str__(self):
@@ -95,17 +121,23 @@ class MessageComponent(MiraiIndexedModel, metaclass=MessageComponentMetaclass):
             )
         ) + ')'
 
+    @trusted_init
     def __init__(self, *args, **kwargs):
-        # 解析参数列表，将位置参数转化为具名参数
-        parameter_names = self.__parameter_names__
-        if len(args) > len(parameter_names):
-            raise TypeError(
-                f'`{self.type}`需要{len(parameter_names)}个参数，但传入了{len(args)}个。'
-            )
-        for name, value in zip(parameter_names, args):
-            if name in kwargs:
-                raise TypeError(f'在 `{self.type}` 中，具名参数 `{name}` 与位置参数重复。')
-            kwargs[name] = value
+        # 解析参数列表，将位置参数转化为具名参数。只有具名参数时无需处理。
+        if args:
+            type_ = self.__class__.__name__
+            parameter_names = self.__parameter_names__
+            parameter_count = self.__parameter_count__
+            if len(args) > parameter_count:
+                raise TypeError(
+                    f'`{type_}`需要{parameter_count}个参数，但传入了{len(args)}个。'
+                )
+            for name, value in zip(parameter_names, args):
+                if name in kwargs:
+                    raise TypeError(
+                        f'在 `{type_}` 中，具名参数 `{name}` 与位置参数重复。'
+                    )
+                kwargs[name] = value
 
         super().__init__(**kwargs)
 
@@ -260,27 +292,43 @@ class MessageChain(MiraiBaseModel):
 
     @staticmethod
     def _parse_message_chain(msg_chain: Iterable):
+        # 按类型查找比 isinstance 快得多，已构造的消息组件直接使用。
+        # 常见的类型精确匹配，其余情况（如子类）再交给 isinstance 判断。
+        component_types = MessageComponentMetaclass.__component_types__
+        parse_subtype = MessageComponent.parse_subtype
         result = []
+        append = result.append
         for msg in msg_chain:
-            if isinstance(msg, dict):
-                result.append(MessageComponent.parse_subtype(msg))
+            msg_type = type(msg)
+            if msg_type is dict:
+                append(parse_subtype(msg))
+            elif msg_type in component_types:
+                append(msg)
+            elif msg_type is str:
+                append(Plain(msg))
+            elif isinstance(msg, dict):
+                append(parse_subtype(msg))
             elif isinstance(msg, MessageComponent):
-                result.append(msg)
+                append(msg)
             elif isinstance(msg, str):
-                result.append(Plain(msg))
+                append(Plain(msg))
             else:
                 raise TypeError(
                     f"消息链中元素需为 dict 或 str 或 MessageComponent，当前类型：{type(msg)}"
                 )
         return result
 
-    @validator('__root__', always=True, pre=True)
+    @classmethod
     def _parse_component(cls, msg_chain):
         if isinstance(msg_chain, (str, MessageComponent)):
             msg_chain = [msg_chain]
         if not msg_chain:
             msg_chain = []
-        return cls._parse_message_chain(msg_chain)
+        try:
+            return cls._parse_message_chain(msg_chain)
+        except (ValueError, TypeError, AssertionError) as e:
+            # 与 pydantic 校验器的行为一致，包装为 ValidationError。
+            raise ValidationError([ErrorWrapper(e, loc='__root__')], cls)
 
     @classmethod
     def parse_obj(cls, msg_chain: Iterable):
@@ -290,13 +338,18 @@ class MessageChain(MiraiBaseModel):
             msg_chain: 列表形式的消息链。
         """
         result = cls._parse_message_chain(msg_chain)
-        return cls(__root__=result)
+        return cls.construct(__root__=result)
 
     def __init__(self, __root__: Iterable[MessageComponent] = None):
-        super().__init__(__root__=__root__)
+        # 解析得到的元素都是消息组件，无需再经过 pydantic 逐个校验，直接写入。
+        object.__setattr__(
+            self, '__dict__', {'__root__': self._parse_component(__root__)}
+        )
+        object.__setattr__(self, '__fields_set__', {'__root__'})
+        self._init_private_attributes()
 
     def __str__(self):
-        return "".join(str(component) for component in self.__root__)
+        return "".join(map(str, self.__root__))
 
     def as_mirai_code(self) -> str:
         """将消息链转换为 mirai 码字符串。
@@ -306,15 +359,13 @@ class MessageChain(MiraiBaseModel):
         Returns:
             mirai 码字符串。
         """
-        return "".join(
-            component.as_mirai_code() for component in self.__root__
-        )
+        return "".join([component.as_mirai_code() for component in self.__root__])
 
     def __repr__(self):
         return f'{self.__class__.__name__}({self.__root__!r})'
 
     def __iter__(self):
-        yield from self.__root__
+        return iter(self.__root__)
 
     @overload
     def get(self, index: int) -> MessageComponent:
@@ -372,22 +423,23 @@ class MessageChain(MiraiBaseModel):
         # 索引对象为 MessageComponent 类，返回所有对应 component
         if isinstance(index, type):
             return [
-                component for component in self if type(component) is index
+                component for component in self.__root__
+                if type(component) is index
             ]
         # 索引对象为 MessageComponent 和 int 构成的 tuple， 返回指定数量的 component
         if isinstance(index, tuple):
+            type_, count = index
             components = (
-                component for component in self if type(component) is index[0]
+                component for component in self.__root__
+                if type(component) is type_
             )
-            return [
-                component for component, _ in zip(components, range(index[1]))
-            ]
+            return list(itertools.islice(components, max(count, 0)))
         raise TypeError(f"消息链索引需为 int 或 MessageComponent，当前类型：{type(index)}")
 
     def get_first(self,
                   t: Type[TMessageComponent]) -> Optional[TMessageComponent]:
         """获取消息链中第一个符合类型的消息组件。"""
-        for component in self:
+        for component in self.__root__:
             if isinstance(component, t):
                 return component
         return None
@@ -456,19 +508,34 @@ class MessageChain(MiraiBaseModel):
             bool: 是否找到。
         """
         if isinstance(sub, type):  # 检测消息链中是否有某种类型的对象
-            for i in self:
+            for i in self.__root__:
                 if type(i) is sub:
                     return True
             return False
         if isinstance(sub, MessageComponent):  # 检查消息链中是否有某个组件
-            for i in self:
-                if i == sub:
+            # type 不同的消息组件必定不相等，先比较 type，省去逐字段比较。
+            sub_type = sub.type
+            for i in self.__root__:
+                if i.type == sub_type and i == sub:
                     return True
             return False
         if isinstance(sub, MessageChain):  # 检查消息链中是否有某个子消息链
-            return bool(kmp(self, sub))
+            # 子消息链通常很短，先比较首个组件的 type 字段，相同时再整段比较，省去 KMP 的预处理。
+            # type 不同的消息组件必定不相等，与逐个比较的结果一致。
+            root = self.__root__
+            sub_root = sub.__root__
+            length = len(sub_root)
+            first_type = sub_root[0].type
+            for i in range(len(root) - length + 1):
+                if root[i].type == first_type and root[i:i + length] == sub_root:
+                    return True
+            return False
         if isinstance(sub, str):  # 检查消息中有无指定字符串子串
-            return sub in deserialize(str(self))
+            text = str(self)
+            # 去转义只影响含反斜杠的文本，大多数消息可以跳过。
+            if '\\' in text:
+                text = deserialize(text)
+            return sub in text
         raise TypeError(f"类型不匹配，当前类型：{type(sub)}")
 
     def __contains__(self, sub) -> bool:
@@ -483,26 +550,31 @@ class MessageChain(MiraiBaseModel):
     def __add__(
         self, other: Union['MessageChain', MessageComponent, str]
     ) -> 'MessageChain':
+        # 两侧都已是消息组件，用 construct 构造，跳过 __init__ 中的解析。
         if isinstance(other, MessageChain):
-            return self.__class__(self.__root__ + other.__root__)
+            return self.__class__.construct(
+                __root__=self.__root__ + other.__root__
+            )
         if isinstance(other, str):
-            return self.__class__(self.__root__ + [Plain(other)])
+            return self.__class__.construct(
+                __root__=self.__root__ + [Plain(other)]
+            )
         if isinstance(other, MessageComponent):
-            return self.__class__(self.__root__ + [other])
+            return self.__class__.construct(__root__=self.__root__ + [other])
         return NotImplemented
 
     def __radd__(self, other: Union[MessageComponent, str]) -> 'MessageChain':
         if isinstance(other, MessageComponent):
-            return self.__class__([other] + self.__root__)
+            return self.__class__.construct(__root__=[other] + self.__root__)
         if isinstance(other, str):
-            return self.__class__(
-                [cast(MessageComponent, Plain(other))] + self.__root__
+            return self.__class__.construct(
+                __root__=[cast(MessageComponent, Plain(other))] + self.__root__
             )
         return NotImplemented
 
     def __mul__(self, other: int):
         if isinstance(other, int):
-            return self.__class__(self.__root__ * other)
+            return self.__class__.construct(__root__=self.__root__ * other)
         return NotImplemented
 
     def __rmul__(self, other: int):
@@ -547,8 +619,10 @@ class MessageChain(MiraiBaseModel):
                 j += l
             if j > l:
                 j = l
+            # 直接访问底层列表，不经过 __getitem__ 的类型分派。
+            root = self.__root__
             for index in range(i, j):
-                if type(self[index]) is x:
+                if type(root[index]) is x:
                     return index
             raise ValueError("消息链中不存在该类型的组件。")
         if isinstance(x, MessageComponent):
@@ -566,7 +640,7 @@ class MessageChain(MiraiBaseModel):
             int: 次数。
         """
         if isinstance(x, type):
-            return sum(1 for i in self if type(i) is x)
+            return len([i for i in self.__root__ if type(i) is x])
         if isinstance(x, MessageComponent):
             return self.__root__.count(x)
         raise TypeError(f"类型不匹配，当前类型：{type(x)}")
@@ -632,16 +706,16 @@ class MessageChain(MiraiBaseModel):
         Returns:
             MessageChain: 剩余的消息链。
         """
-        def _exclude():
-            nonlocal count
-            x_is_type = isinstance(x, type)
-            for c in self:
-                if count > 0 and ((x_is_type and type(c) is x) or c == x):
-                    count -= 1
-                    continue
-                yield c
-
-        return self.__class__(_exclude())
+        x_is_type = isinstance(x, type)
+        result = []
+        for c in self.__root__:
+            # 消息组件与类型比较必定不相等，x 为类型时无需调用 __eq__。
+            if count > 0 and (type(c) is x if x_is_type else c == x):
+                count -= 1
+                continue
+            result.append(c)
+        # 剩余元素都来自本消息链，已是消息组件，无需再次解析。
+        return self.__class__.construct(__root__=result)
 
     def reverse(self):
         """将消息链原地翻转。"""
@@ -649,10 +723,8 @@ class MessageChain(MiraiBaseModel):
 
     @classmethod
     def join(cls, *args: Iterable[Union[str, MessageComponent]]):
-        return cls(
-            Plain(c) if isinstance(c, str) else c
-            for c in itertools.chain(*args)
-        )
+        # 字符串元素由 __init__ 统一转换为 Plain，这里无需再逐个判断。
+        return cls(itertools.chain(*args))
 
     @property
     def source(self) -> Optional['Source']:
@@ -665,6 +737,10 @@ class MessageChain(MiraiBaseModel):
         source = self.source
         return source.id if source else -1
 
+    class Config:
+        # 作为字段传入已构造的消息链时，直接使用该对象，不再复制。
+        copy_on_model_validation = NO_COPY_ON_MODEL_VALIDATION
+
 
 TMessage = Union[MessageChain, Iterable[Union[MessageComponent, str]],
                  MessageComponent, str]
@@ -687,6 +763,24 @@ class Plain(MessageComponent):
     """消息组件类型。"""
     text: str
     """文字消息。"""
+    @trusted_init
+    def __init__(self, *args, **kwargs):
+        # 最常见的 `Plain('...')`，文本已是 str，直接写入，无需经过 pydantic 校验。
+        if (
+            not kwargs and len(args) == 1 and args[0].__class__ is str
+            and self.__class__ is Plain
+        ):
+            object.__setattr__(
+                self, '__dict__', {
+                    'type': 'Plain',
+                    'text': args[0]
+                }
+            )
+            object.__setattr__(self, '__fields_set__', {'text'})
+            self._init_private_attributes()
+            return
+        super().__init__(*args, **kwargs)
+
     def __str__(self):
         return self.text
 
@@ -713,6 +807,8 @@ class Quote(MessageComponent):
     """被引用回复的原消息的消息链对象。"""
     @validator("origin", always=True, pre=True)
     def origin_formater(cls, v):
+        if isinstance(v, MessageChain):  # 已构造的消息链无需再次解析。
+            return v
         return MessageChain.parse_obj(v)
 
 
@@ -785,6 +881,36 @@ class MarketFace(MessageComponent):
     """商店表情名称。"""
 
 
+def _resolve_path(path: Union[str, Path, None]) -> Optional[str]:
+    """将路径转换为绝对路径，文件不存在时引发 ValueError。
+
+    结果与 `str(Path(path).resolve(strict=True))` 相同，省去了创建 `Path` 对象的开销。
+    """
+    if not path:
+        return path  # type: ignore
+    resolved = os.path.realpath(path)
+    if not os.path.exists(resolved):
+        raise ValueError(f"无效路径：{path}")
+    return resolved
+
+
+def _sniff_image(content: bytes) -> Optional[str]:
+    """根据文件头判断图片格式。常见格式的结果与 `imghdr.what` 一致，无法识别时返回 None。"""
+    if content[:8] == b'\x89PNG\r\n\x1a\n':
+        return 'png'
+    if content[:3] == b'\xff\xd8\xff':
+        return 'jpeg'
+    if content[:6] in (b'GIF87a', b'GIF89a'):
+        return 'gif'
+    if content[:4] == b'RIFF' and content[8:12] == b'WEBP':
+        return 'webp'
+    if content[:2] == b'BM':
+        return 'bmp'
+    if content[:2] in (b'MM', b'II'):
+        return 'tiff'
+    return None
+
+
 class Image(MessageComponent):
     """图片。"""
     type: str = "Image"
@@ -815,13 +941,7 @@ class Image(MessageComponent):
     @validator('path')
     def validate_path(cls, path: Union[str, Path, None]):
         """修复 path 参数的行为，使之相对于 YiriMirai 的启动路径。"""
-        if path:
-            try:
-                return str(Path(path).resolve(strict=True))
-            except FileNotFoundError:
-                raise ValueError(f"无效路径：{path}")
-        else:
-            return path
+        return _resolve_path(path)
 
     @property
     def uuid(self):
@@ -865,29 +985,33 @@ class Image(MessageComponent):
 
         import httpx
         async with httpx.AsyncClient() as client:
-            response = await client.get(self.url)
-            response.raise_for_status()
-            content = response.content
-
-            if filename:
-                path = Path(filename)
-                if determine_type:
-                    import imghdr
-                    path = path.with_suffix(
-                        '.' + str(imghdr.what(None, content))
-                    )
-                path.parent.mkdir(parents=True, exist_ok=True)
-            elif directory:
-                import imghdr
-                path = Path(directory)
-                path.mkdir(parents=True, exist_ok=True)
-                path = path / f'{self.uuid}.{imghdr.what(None, content)}'
-            else:
-                raise ValueError("请指定文件路径或文件夹路径！")
+            async with client.stream('GET', self.url) as response:
+                response.raise_for_status()
+                # 先读取文件头以判断图片格式，其余部分边下载边写入，不在内存中保存整个文件。
+                chunks = response.aiter_bytes()
+                head = b''
+                async for chunk in chunks:
+                    head += chunk
+                    if len(head) >= 12:
+                        break
+
+                if filename:
+                    path = Path(filename)
+                    if determine_type:
+                        path = path.with_suffix('.' + str(_sniff_image(head)))
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                elif directory:
+                    path = Path(directory)
+                    path.mkdir(parents=True, exist_ok=True)
+                    path = path / f'{self.uuid}.{_sniff_image(head)}'
+                else:
+                    raise ValueError("请指定文件路径或文件夹路径！")
 
-            import aiofiles
-            async with aiofiles.open(path, 'wb') as f:
-                await f.write(content)
+                import aiofiles
+                async with aiofiles.open(path, 'wb') as f:
+                    await f.write(head)
+                    async for chunk in chunks:
+                        await f.write(chunk)
 
             return path
 
@@ -910,15 +1034,32 @@ class Image(MessageComponent):
             pass
         elif filename:
             path = Path(filename)
-            import aiofiles
-            async with aiofiles.open(path, 'rb') as f:
-                content = await f.read()
+            # 小文件直接读取，省去线程池调度的开销。
+            if path.stat().st_size < _SMALL_FILE_SIZE:
+                content = path.read_bytes()
+            else:
+                import aiofiles
+                async with aiofiles.open(path, 'rb') as f:
+                    content = await f.read()
         else:
             raise ValueError("请指定图片路径或图片内容！")
-        import base64
-        img = cls(base64=base64.b64encode(content).decode())
+        img = cls(base64=b64encode(content).decode('ascii'))
         return img
 
+    @classmethod
+    def from_base64(cls, base64: str) -> "Image":
+        """从 base64 编码的图片内容构造图片对象，不做校验。
+
+        多次发送同一张图片时，可以保存 `from_local` 得到的 `base64` 属性，之后用此方法构造，省去重复读取和编码。
+
+        Args:
+            base64: 图片内容的 base64 编码。
+
+        Returns:
+            Image: 图片对象。
+        """
+        return cls.construct(base64=base64)
+
     @classmethod
     def from_unsafe_path(cls, path: Union[str, Path]) -> "Image":
         """从不安全的路径加载图片。
@@ -1023,6 +1164,16 @@ POKE_NAME = {
     "SuiPing": '碎屏',
     "QiaoMen": '敲门',
 }
+POKE_MIRAI_CODE: Dict[str, str] = {
+    name: f'[mirai:poke:{name},{type_},{POKE_ID[name]}]'
+    for name, type_ in POKE_TYPE.items()
+}
+"""各戳一戳对应的 mirai 码，取值范围固定，导入时预先生成。"""
+POKE_TEXT: Dict[str, str] = {
+    name: f'[{text}]'
+    for name, text in POKE_NAME.items()
+}
+"""各戳一戳对应的文字表示。"""
 
 
 class PokeNames(str, Enum):
@@ -1063,10 +1214,10 @@ class Poke(MessageComponent):
         return POKE_ID[self.name]
 
     def __str__(self):
-        return f'[{POKE_NAME[self.name]}]'
+        return POKE_TEXT[self.name]
 
     def as_mirai_code(self) -> str:
-        return f'[mirai:poke:{self.name},{self.poke_type},{self.poke_id}]'
+        return POKE_MIRAI_CODE[self.name]
 
 
 class Unknown(MessageComponent):
@@ -1120,13 +1271,7 @@ class Voice(MessageComponent):
     @validator('path')
     def validate_path(cls, path: Optional[str]):
         """修复 path 参数的行为，使之相对于 YiriMirai 的启动路径。"""
-        if path:
-            try:
-                return str(Path(path).resolve(strict=True))
-            except FileNotFoundError:
-                raise ValueError(f"无效路径：{path}")
-        else:
-            return path
+        return _resolve_path(path)
 
     def __str__(self):
         return '[语音]'
@@ -1150,23 +1295,24 @@ class Voice(MessageComponent):
 
         import httpx
         async with httpx.AsyncClient() as client:
-            response = await client.get(self.url)
-            response.raise_for_status()
-            content = response.content
-
-            if filename:
-                path = Path(filename)
-                path.parent.mkdir(parents=True, exist_ok=True)
-            elif directory:
-                path = Path(directory)
-                path.mkdir(parents=True, exist_ok=True)
-                path = path / f'{self.voice_id}.silk'
-            else:
-                raise ValueError("请指定文件路径或文件夹路径！")
+            async with client.stream('GET', self.url) as response:
+                response.raise_for_status()
+
+                if filename:
+                    path = Path(filename)
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                elif directory:
+                    path = Path(directory)
+                    path.mkdir(parents=True, exist_ok=True)
+                    path = path / f'{self.voice_id}.silk'
+                else:
+                    raise ValueError("请指定文件路径或文件夹路径！")
 
-            import aiofiles
-            async with aiofiles.open(path, 'wb') as f:
-                await f.write(content)
+                # 边下载边写入，不在内存中保存整个文件。
+                import aiofiles
+                async with aiofiles.open(path, 'wb') as f:
+                    async for chunk in response.aiter_bytes():
+                        await f.write(chunk)
 
     @classmethod
     async def from_local(
@@ -1184,15 +1330,32 @@ class Voice(MessageComponent):
             pass
         if filename:
             path = Path(filename)
-            import aiofiles
-            async with aiofiles.open(path, 'rb') as f:
-                content = await f.read()
+            # 小文件直接读取，省去线程池调度的开销。
+            if path.stat().st_size < _SMALL_FILE_SIZE:
+                content = path.read_bytes()
+            else:
+                import aiofiles
+                async with aiofiles.open(path, 'rb') as f:
+                    content = await f.read()
         else:
             raise ValueError("请指定语音路径或语音内容！")
-        import base64
-        img = cls(base64=base64.b64encode(content).decode())
+        img = cls(base64=b64encode(content).decode('ascii'))
         return img
 
+    @classmethod
+    def from_base64(cls, base64: str) -> "Voice":
+        """从 base64 编码的语音内容构造语音对象，不做校验。
+
+        多次发送同一段语音时，可以保存 `from_local` 得到的 `base64` 属性，之后用此方法构造，省去重复读取和编码。
+
+        Args:
+            base64: 语音内容的 base64 编码。
+
+        Returns:
+            Voice: 语音对象。
+        """
+        return cls.construct(base64=base64)
+
 
 class Dice(MessageComponent):
     """骰子。"""
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+比较 `Event.parse_subtype` 的可信构造与 pydantic `parse_obj` 的结果。
+"""
+import copy
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+import pytest
+from pydantic.fields import ModelField
+from pydantic.typing import all_literal_values, is_literal_type
+
+from mirai.models.base import MiraiBaseModel
+from mirai.models.entities import Group, GroupMember
+from mirai.models.events import Event, GroupMessage
+from mirai.models.message import MessageChain
+
+CHAIN = [
+    {'type': 'Source', 'id': 10, 'time': 1600000000},
+    {'type': 'Plain', 'text': 'hello [x]:,\\\n'},
+    {'type': 'At', 'target': 5, 'display': '@d'},
+    {'type': 'Face', 'faceId': 1, 'name': 'smile'},
+    {'type': 'Poke', 'name': 'ChuoYiChuo'},
+    {
+        'type': 'Quote', 'id': 1, 'groupId': 2, 'senderId': 3, 'targetId': 4,
+        'origin': [{'type': 'Plain', 'text': 'o'}]
+    },
+]
+
+
+def sample_value(field: ModelField) -> Any:
+    """根据字段类型生成 mirai-api-http 格式的取值。"""
+    type_ = field.type_
+    if is_literal_type(type_):
+        return all_literal_values(type_)[0]
+    if type_ is datetime:
+        return 1600000000
+    if type_ is bool:
+        return True
+    if type_ is int:
+        return 1
+    if type_ is str:
+        return 'text'
+    if issubclass(type_, Enum):
+        return next(iter(type_)).value
+    if issubclass(type_, MessageChain):
+        return copy.deepcopy(CHAIN)
+    if issubclass(type_, MiraiBaseModel):
+        return sample_dict(type_)
+    raise TypeError(f'未处理的字段类型：{type_}')
+
+
+def sample_dict(model: Any, optional: bool = True) -> Dict[str, Any]:
+    """生成模型的 dict 形式的数据。
+
+    Args:
+        model: 模型类型。
+        optional: 是否为可选字段生成取值。
+    """
+    data = {}
+    for name, field in model.__fields__.items():
+        if name == 'type':
+            continue
+        if field.required or optional:
+            data[field.alias] = sample_value(field)
+    if issubclass(model, Event):
+        data['type'] = model.__name__
+    return data
+
+
+EVENT_TYPES = sorted(Event.__indexes__)
+
+
+def assert_same(trusted: Event, validated: Event):
+    assert type(trusted) is type(validated)
+    assert trusted == validated
+    assert trusted.__fields_set__ == validated.__fields_set__
+    assert trusted.dict(by_alias=True) == validated.dict(by_alias=True)
+
+
+@pytest.mark.parametrize('name', EVENT_TYPES)
+@pytest.mark.parametrize('optional', [True, False])
+def test_trusted_parser_matches_parse_obj(name: str, optional: bool):
+    model = Event.__indexes__[name]
+    data = sample_dict(model, optional)
+    trusted = Event.parse_subtype(copy.deepcopy(data))
+    validated = model.parse_obj(copy.deepcopy(data))
+    assert_same(trusted, validated)
+
+
+@pytest.mark.parametrize('name', EVENT_TYPES)
+def test_trusted_parser_accepts_model_instances(name: str):
+    """嵌套模型字段传入已构造的对象时，结果与 `parse_obj` 相同。"""
+    model = Event.__indexes__[name]
+    data = sample_dict(model)
+    for name_, field in model.__fields__.items():
+        type_ = field.type_
+        if isinstance(type_, type) and issubclass(type_, MiraiBaseModel):
+            data[field.alias] = type_.parse_obj(data[field.alias])
+    trusted = Event.parse_subtype(dict(data))
+    validated = model.parse_obj(dict(data))
+    assert_same(trusted, validated)
+
+
+def parse_or_fallback(model, data: Dict[str, Any]) -> Event:
+    """与 `Event.parse_subtype` 相同，数据不合法时回退到 `Event`。"""
+    try:
+        return model.parse_obj(data)
+    except ValueError:
+        return Event(type=data['type'])
+
+
+@pytest.mark.parametrize('name', EVENT_TYPES)
+def test_trusted_parser_null_fields(name: str):
+    """字段为 None 时，结果与 `parse_obj` 相同：不允许为 None 的字段使解析失败。"""
+    model = Event.__indexes__[name]
+    for field in model.__fields__.values():
+        if field.name == 'type':
+            continue
+        data = sample_dict(model)
+        data[field.alias] = None
+        trusted = Event.parse_subtype(copy.deepcopy(data))
+        assert_same(trusted, parse_or_fallback(model, copy.deepcopy(data)))
+
+
+def test_null_message_chain_is_rejected():
+    data = sample_dict(Event.__indexes__['FriendMessage'])
+    data['messageChain'] = None
+    assert type(Event.parse_subtype(data)) is Event
+    data = sample_dict(Event.__indexes__['CommandExecutedEvent'])
+    data['args'] = None
+    assert type(Event.parse_subtype(data)) is Event
+
+
+def test_nested_instance_regression():
+    group = Group(id=1, name='g', permission='MEMBER')
+    member = GroupMember(
+        id=2, member_name='m', permission='MEMBER', group=group
+    )
+    data = {
+        'type': 'GroupMessage',
+        'sender': member,
+        'messageChain': [{
+            'type': 'Plain',
+            'text': 'hi'
+        }],
+    }
+    trusted = Event.parse_subtype(dict(data))
+    assert isinstance(trusted, GroupMessage)
+    assert_same(trusted, GroupMessage.parse_obj(dict(data)))
+
+
+def test_trusted_parser_falls_back_on_invalid_data():
+    """类型不符的数据交由 pydantic 处理，转换后的结果与 `parse_obj` 相同。"""
+    data = sample_dict(GroupMessage)
+    data['sender']['id'] = '2'
+    assert_same(
+        Event.parse_subtype(copy.deepcopy(data)),
+        GroupMessage.parse_obj(copy.deepcopy(data))
+    )
+    data['sender'] = 5
+    assert type(Event.parse_subtype(data)) is Event
+
+
+def test_unknown_event():
+    event = Event.parse_subtype({'type': 'SomeFutureEvent', 'foo': 1})
+    assert type(event) is Event
+    assert event.type == 'SomeFutureEvent'
+
+
+class _Defaults(MiraiBaseModel):
+    __trusted__ = True
+    nan: float = float('nan')
+    inf: float = float('inf')
+    text: Optional[str] = None
+
+
+def test_trusted_parser_defaults_without_literal_repr():
+    model = _Defaults.parse_trusted({})
+    assert _Defaults.get_trusted_plan() is not None
+    assert model.nan != model.nan
+    assert model.inf == float('inf')
+    assert model.text is None
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+消息链与消息组件的行为测试。
+"""
+import asyncio
+import os
+import random
+from pathlib import Path
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from mirai.models.message import (
+    At, AtAll, Face, Image, MessageChain, MiraiCode, Plain, Poke, Voice,
+    _resolve_path, deserialize, serialize
+)
+from mirai.utils import kmp
+
+COMPONENTS = [
+    Plain('a'),
+    Plain('b'),
+    At(target=1),
+    At(target=2),
+    Face(face_id=1),
+    AtAll(),
+]
+
+
+def random_chain(rng: random.Random, max_length: int = 8) -> MessageChain:
+    return MessageChain(
+        [rng.choice(COMPONENTS) for _ in range(rng.randint(0, max_length))]
+    )
+
+
+def test_construct_from_components_and_dicts():
+    chain = MessageChain([Plain('hi'), At(target=1), 'x'])
+    parsed = MessageChain.parse_obj([
+        {
+            'type': 'Plain',
+            'text': 'hi'
+        },
+        {
+            'type': 'At',
+            'target': 1
+        },
+        'x',
+    ])
+    assert chain == parsed
+    assert chain.__root__ == [Plain('hi'), At(target=1), Plain('x')]
+    assert chain.__fields_set__ == parsed.__fields_set__ == {'__root__'}
+    assert MessageChain('abc').__root__ == [Plain('abc')]
+    assert MessageChain(Plain('abc')).__root__ == [Plain('abc')]
+    assert MessageChain().__root__ == []
+
+
+def test_construct_invalid_element():
+    with pytest.raises(ValidationError) as exc_info:
+        MessageChain([Plain('a'), 1])
+    assert exc_info.value.errors()[0]['loc'] == ('__root__', )
+
+
+def test_plain_fast_path():
+    fast = Plain('x')
+    slow = Plain(text='x')
+    assert fast == slow
+    assert fast.__dict__ == slow.__dict__
+    assert fast.__fields_set__ == slow.__fields_set__
+    assert Plain(1).text == '1'
+
+
+def test_has_sub_chain_matches_kmp():
+    rng = random.Random(0)
+    for _ in range(2000):
+        chain = random_chain(rng)
+        sub = random_chain(rng, 3)
+        if not sub:
+            continue
+        assert chain.has(sub) == bool(kmp(chain, sub))
+
+
+class _At(At):
+    pass
+
+
+def test_has_sub_chain_with_equal_subclass():
+    """类型不同但相等的消息组件，与 KMP 的结果一致。"""
+    chain = MessageChain([Plain('a'), _At(target=1), Plain('b')])
+    sub = MessageChain([At(target=1), Plain('b')])
+    assert _At(target=1) == At(target=1)
+    assert chain.has(sub) == bool(kmp(chain, sub)) is True
+
+
+def test_has_str_matches_deserialized_text():
+    rng = random.Random(0)
+    chars = 'ab[]:,\\\n'
+    for _ in range(2000):
+        text = ''.join(rng.choice(chars) for _ in range(rng.randint(0, 8)))
+        chain = MessageChain([Plain(text), MiraiCode(code=text)])
+        sub = ''.join(rng.choice(chars) for _ in range(rng.randint(0, 3)))
+        assert chain.has(sub) == (sub in deserialize(str(chain)))
+
+
+def test_exclude_matches_reference():
+    def reference(chain, x, count):
+        result = []
+        for c in chain:
+            if count > 0 and (
+                (isinstance(x, type) and type(c) is x) or c == x
+            ):
+                count -= 1
+                continue
+            result.append(c)
+        return result
+
+    rng = random.Random(0)
+    for _ in range(500):
+        chain = random_chain(rng)
+        for x in (Plain, At, Plain('a'), At(target=1)):
+            for count in (-1, 0, 1, 2, 10):
+                assert chain.exclude(x, count).__root__ == reference(
+                    chain, x, count
+                )
+
+
+def test_arithmetic_matches_constructor():
+    chain = MessageChain([Plain('a'), At(target=1)])
+    other = MessageChain([Face(face_id=1)])
+    assert chain + other == MessageChain(chain.__root__ + other.__root__)
+    assert chain + 'x' == MessageChain(chain.__root__ + [Plain('x')])
+    assert 'x' + chain == MessageChain([Plain('x')] + chain.__root__)
+    assert chain + AtAll() == MessageChain(chain.__root__ + [AtAll()])
+    assert chain * 3 == MessageChain(chain.__root__ * 3)
+    assert 2 * chain == MessageChain(chain.__root__ * 2)
+    assert (chain + other).__fields_set__ == {'__root__'}
+
+
+def test_query_methods():
+    chain = MessageChain([Plain('a'), At(target=1), Plain('b'), Face(face_id=1)])
+    assert chain.get(Plain) == [Plain('a'), Plain('b')]
+    assert chain.get((Plain, 1)) == [Plain('a')]
+    assert chain.get(Plain, -1) == []
+    assert chain.count(Plain) == 2
+    assert chain.count(At(target=1)) == 1
+    assert chain.index(At) == 1
+    assert chain.index(Plain, 1) == 2
+    assert chain.has(Face)
+    assert At(target=1) in chain
+    assert list(chain) == chain.__root__
+    assert str(MessageChain.join(chain, ['x'])) == str(chain) + 'x'
+
+
+def test_serialize_round_trip():
+    text = 'hello [x]:,\\\n\r'
+    assert serialize(text) == 'hello \\[x\\]\\:\\,\\\\\\n\\r'
+    assert deserialize(serialize(text)) == text
+
+
+def test_poke_mirai_code():
+    poke = Poke(name='ChuoYiChuo')
+    assert poke.as_mirai_code() == '[mirai:poke:ChuoYiChuo,1,-1]'
+    assert str(poke) == '[戳一戳]'
+    assert Poke(name='Rose').as_mirai_code() == '[mirai:poke:Rose,126,2007]'
+
+
+def test_resolve_path(tmp_path: Path, monkeypatch):
+    file = tmp_path / 'a.png'
+    file.write_bytes(b'')
+    monkeypatch.chdir(tmp_path)
+    assert _resolve_path('a.png') == str(Path('a.png').resolve(strict=True))
+    assert _resolve_path(file) == str(file.resolve(strict=True))
+    assert _resolve_path(None) is None
+    with pytest.raises(ValueError):
+        _resolve_path('missing.png')
+
+
+PNG = b'\x89PNG\r\n\x1a\n' + os.urandom(1000)
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """让 httpx.AsyncClient 分块返回 `PNG` 的内容。"""
+    async def stream():
+        for i in range(0, len(PNG), 5):
+            yield PNG[i:i + 5]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=stream())
+
+    client = httpx.AsyncClient
+
+    def factory(*args, **kwargs):
+        return client(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(httpx, 'AsyncClient', factory)
+
+
+def test_image_download(tmp_path: Path, mock_client):
+    image = Image(
+        image_id='{01E9451B-70ED-EAE3-B37C-101F1EEBF5B5}.jpg',
+        url='http://example.com/a.jpg',
+        width=1,
+        height=1
+    )
+    path = asyncio.run(image.download(filename=tmp_path / 'img'))
+    assert path == tmp_path / 'img.png'
+    assert path.read_bytes() == PNG
+
+    path = asyncio.run(image.download(directory=tmp_path / 'dir'))
+    assert path.name == '01E9451B-70ED-EAE3-B37C-101F1EEBF5B5.png'
+    assert path.read_bytes() == PNG
+
+
+def test_voice_download(tmp_path: Path, mock_client):
+    voice = Voice(voice_id='v', url='http://example.com/a.silk')
+    asyncio.run(voice.download(directory=tmp_path))
+    assert (tmp_path / 'v.silk').read_bytes() == PNG